@@ -0,0 +1,59 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.20;
+
+import "./AsproLaunchpad.sol";
+
+// MinimalERC721 whose name and symbol are set by initialize(), since EIP-1167
+// clones share this code but never run its constructor
+contract CollectionImplementation is MinimalERC721 {
+    bool private _initialized;
+
+    constructor() MinimalERC721("", "") {}
+
+    function initialize(string memory _name, string memory _symbol) public {
+        require(!_initialized, "Already initialized");
+        _initialized = true;
+        name = _name;
+        symbol = _symbol;
+    }
+}
+
+contract LaunchpadFactory {
+    // Shared collection logic that every clone delegates to
+    address public immutable implementation;
+
+    event CollectionCreated(address indexed collection, address indexed creator, string name, string symbol);
+
+    constructor() {
+        implementation = address(new CollectionImplementation());
+    }
+
+    function createCollection(string memory _name, string memory _symbol, bytes32 salt) public returns (address collection) {
+        // Bind the salt to the caller so nobody can squat a creator's predicted address
+        bytes32 finalSalt = keccak256(abi.encodePacked(msg.sender, salt));
+        address impl = implementation;
+
+        // EIP-1167 minimal proxy init code, deployed with CREATE2
+        assembly {
+            let ptr := mload(0x40)
+            mstore(ptr, 0x3d602d80600a3d3981f3363d3d373d3d3d363d73000000000000000000000000)
+            mstore(add(ptr, 0x14), shl(0x60, impl))
+            mstore(add(ptr, 0x28), 0x5af43d82803e903d91602b57fd5bf30000000000000000000000000000000000)
+            collection := create2(0, ptr, 0x37, finalSalt)
+        }
+        require(collection != address(0), "Collection already exists");
+
+        CollectionImplementation(collection).initialize(_name, _symbol);
+        emit CollectionCreated(collection, msg.sender, _name, _symbol);
+    }
+
+    function predictAddress(address creator, bytes32 salt) public view returns (address) {
+        bytes32 finalSalt = keccak256(abi.encodePacked(creator, salt));
+        bytes32 initCodeHash = keccak256(abi.encodePacked(
+            hex"3d602d80600a3d3981f3363d3d373d3d3d363d73",
+            implementation,
+            hex"5af43d82803e903d91602b57fd5bf3"
+        ));
+        return address(uint160(uint256(keccak256(abi.encodePacked(bytes1(0xff), address(this), finalSalt, initCodeHash)))));
+    }
+}
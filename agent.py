@@ -3,11 +3,9 @@ import json
 import re
 
 # Local module imports
-from nft_data import get_collection_info, register_new_collection, NFT_COLLECTIONS
+from nft_data import get_collection_info, register_new_collection, get_all_collections
 from blockchain_utils import AGENT_WALLET, verify_payment_transaction, execute_mint_nft
 
-import opengradient as og
-
 def check_collection_availability(collection_name: str) -> str:
     """Use this to check if an NFT collection exists and get its mint price, gas fees, and rules."""
     return get_collection_info(collection_name)
@@ -51,7 +49,7 @@ def verify_payment_and_mint_nft(transaction_hash: str, user_wallet_address: str,
     return f"Success! Verification passed:\n{verify_result}\n\nMinting Result:\n{mint_result}"
 
 def get_system_prompt():
-    available_collections = ", ".join(NFT_COLLECTIONS.keys())
+    available_collections = ", ".join(get_all_collections().keys())
     return f"""
     You are the OpenGradient NFT Launchpad AI Agent. Your job is to help users mint NFTs, and optionally deploy new NFT collections.
     Follow this strict workflow:
@@ -136,6 +134,9 @@ async def chat_with_agent(user_input: str, conversation_history: list):
         return
         
     try:
+        # Imported on first real chat so cold starts and mock mode skip the SDK
+        import opengradient as og
+
         # 1. Initialize OpenGradient Native Client using the latest SDK
         llm = og.LLM(private_key=private_key)
         
@@ -4,21 +4,39 @@ import os
 # Ensure the root directory logic is accessible
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from flask import Flask, request, jsonify, send_from_directory
-from agent import chat_with_agent
-
-ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+from flask import Flask, Response, request, jsonify, abort
+from assets import get_asset_table, choose_encoding, etag_matches
 
 app = Flask(__name__)
 
+def serve_asset(filename):
+    # Only allow-listed front-end assets are served, straight from memory
+    asset = get_asset_table().get(filename)
+    if asset is None:
+        abort(404)
+
+    encoding = choose_encoding(request.headers.get('Accept-Encoding'), asset['bodies'])
+    etag = asset['etags'][encoding]
+    headers = {
+        'ETag': etag,
+        'Cache-Control': asset['cache_control'],
+        'Vary': 'Accept-Encoding',
+    }
+
+    if etag_matches(request.headers.get('If-None-Match'), etag):
+        return Response(status=304, headers=headers)
+
+    if encoding != 'identity':
+        headers['Content-Encoding'] = encoding
+    return Response(asset['bodies'][encoding], content_type=asset['content_type'], headers=headers)
+
 @app.route('/')
 def home():
-    return send_from_directory(ROOT_DIR, 'index.html')
+    return serve_asset('index.html')
 
 @app.route('/<path:filename>')
 def serve_static(filename):
-    # Serve css, js, etc.
-    return send_from_directory(ROOT_DIR, filename)
+    return serve_asset(filename)
 
 @app.route('/api/chat', methods=['POST'])
 def chat():
@@ -30,8 +48,10 @@ def chat():
     if not user_input:
         return jsonify({"error": "No message provided"}), 400
         
-    from flask import Response, stream_with_context
+    from flask import stream_with_context
     import asyncio
+    # Deferred so static routes never load the agent, its SDK or the blockchain client
+    from agent import chat_with_agent
     
     def generate():
         try:
@@ -0,0 +1,174 @@
+import os
+import gzip
+import hashlib
+import json
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+DIST_DIR = os.path.join(ROOT_DIR, "static_dist")
+MANIFEST_PATH = os.path.join(DIST_DIR, "manifest.json")
+
+# The only files the site serves; everything else in the repo stays private
+ENTRY_PAGE = "index.html"
+FINGERPRINTED_ASSETS = ["style.css", "script.js"]
+
+CONTENT_TYPES = {
+    ".html": "text/html; charset=utf-8",
+    ".css": "text/css; charset=utf-8",
+    ".js": "text/javascript; charset=utf-8",
+}
+
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+# The page and the unversioned asset names are revalidated on every load via ETag
+REVALIDATE_CACHE = "no-cache"
+
+# Best first; identity is always acceptable as a fallback
+_ENCODING_PREFERENCE = ["br", "gzip"]
+_FILE_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+_asset_table = None
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+def _read(name: str) -> bytes:
+    with open(os.path.join(ROOT_DIR, name), "rb") as f:
+        return f.read()
+
+def _fingerprinted_name(name: str, data: bytes) -> str:
+    stem, ext = os.path.splitext(name)
+    return f"{stem}.{_digest(data)[:12]}{ext}"
+
+def _compress(data: bytes) -> dict:
+    """Precompressed variants, kept only when they actually save bytes."""
+    variants = {"gzip": gzip.compress(data, compresslevel=9, mtime=0)}
+    # Imported here so serving the prebuilt static_dist/ never loads Brotli
+    try:
+        import brotli
+        variants["br"] = brotli.compress(data, quality=11)
+    except ImportError:  # gzip-only serving when Brotli isn't installed
+        pass
+    return {enc: body for enc, body in variants.items() if len(body) < len(data)}
+
+def _entry(name: str, bodies: dict, cache_control: str) -> dict:
+    etag = _digest(bodies["identity"])[:16]
+    return {
+        "content_type": CONTENT_TYPES[os.path.splitext(name)[1]],
+        "cache_control": cache_control,
+        "bodies": bodies,
+        "etags": {enc: f'"{etag}"' if enc == "identity" else f'"{etag}-{enc}"' for enc in bodies},
+    }
+
+def _source_hashes() -> dict:
+    return {name: _digest(_read(name)) for name in [ENTRY_PAGE] + FINGERPRINTED_ASSETS}
+
+def build_assets() -> dict:
+    """
+    Fingerprints the front-end assets, rewrites index.html to reference them,
+    and precompresses everything. Returns {filename: {"bodies": {encoding: bytes}}}.
+    """
+    outputs = {}
+    renames = {}
+    for name in FINGERPRINTED_ASSETS:
+        data = _read(name)
+        renames[name] = _fingerprinted_name(name, data)
+        outputs[renames[name]] = data
+
+    page = _read(ENTRY_PAGE).decode("utf-8")
+    for name, fingerprinted in renames.items():
+        page = page.replace(f'"{name}"', f'"{fingerprinted}"')
+    outputs[ENTRY_PAGE] = page.encode("utf-8")
+
+    return {
+        "renames": renames,
+        "files": {name: {"identity": data, **_compress(data)} for name, data in outputs.items()},
+    }
+
+def write_dist(build: dict):
+    """Writes the build to static_dist/ with a manifest tying it to the sources."""
+    os.makedirs(DIST_DIR, exist_ok=True)
+    for name, bodies in build["files"].items():
+        for encoding, body in bodies.items():
+            with open(os.path.join(DIST_DIR, name + _FILE_SUFFIXES.get(encoding, "")), "wb") as f:
+                f.write(body)
+
+    manifest = {
+        "sources": _source_hashes(),
+        "renames": build["renames"],
+        "files": {name: sorted(bodies) for name, bodies in build["files"].items()},
+    }
+    with open(MANIFEST_PATH, "w") as f:
+        json.dump(manifest, f, indent=2)
+
+def _load_dist():
+    """Reads static_dist/ back, or returns None if it is missing or stale."""
+    try:
+        with open(MANIFEST_PATH, "r") as f:
+            manifest = json.load(f)
+        if manifest["sources"] != _source_hashes():
+            return None
+
+        files = {}
+        for name, encodings in manifest["files"].items():
+            files[name] = {}
+            for encoding in encodings:
+                with open(os.path.join(DIST_DIR, name + _FILE_SUFFIXES.get(encoding, "")), "rb") as f:
+                    files[name][encoding] = f.read()
+        return {"renames": manifest["renames"], "files": files}
+    except (OSError, ValueError, KeyError):
+        return None
+
+def get_asset_table() -> dict:
+    """
+    Returns the in-memory table of servable assets keyed by URL filename,
+    loading the build-time output from static_dist/ or building it on first call.
+    """
+    global _asset_table
+    if _asset_table is None:
+        build = _load_dist() or build_assets()
+        files = build["files"]
+
+        table = {ENTRY_PAGE: _entry(ENTRY_PAGE, files[ENTRY_PAGE], REVALIDATE_CACHE)}
+        for name, fingerprinted in build["renames"].items():
+            table[fingerprinted] = _entry(fingerprinted, files[fingerprinted], IMMUTABLE_CACHE)
+            # Keep the plain name working for pages cached before fingerprinting
+            table[name] = _entry(name, files[fingerprinted], REVALIDATE_CACHE)
+        _asset_table = table
+    return _asset_table
+
+def choose_encoding(accept_encoding: str, available) -> str:
+    """Picks the best available content-coding allowed by an Accept-Encoding header."""
+    weights = {}
+    for part in (accept_encoding or "").split(","):
+        coding, _, params = part.strip().partition(";")
+        if not coding:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[coding.strip().lower()] = q
+
+    candidates = [enc for enc in _ENCODING_PREFERENCE if enc in available]
+    best = max(candidates, key=lambda enc: weights.get(enc, weights.get("*", 0.0)), default=None)
+    if best and weights.get(best, weights.get("*", 0.0)) > 0:
+        return best
+    return "identity"
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+
+if __name__ == "__main__":
+    result = build_assets()
+    write_dist(result)
+    for name, bodies in sorted(result["files"].items()):
+        sizes = "  ".join(f"{enc}={len(body):,}B" for enc, body in sorted(bodies.items()))
+        print(f"{name}: {sizes}")
+    if not any("br" in bodies for bodies in result["files"].values()):
+        print("Brotli not installed; wrote gzip variants only.")
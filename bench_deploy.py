@@ -0,0 +1,136 @@
+"""
+Measures gas and wall time per collection deploy on a local EVM, comparing the
+full MinimalERC721 deploy against LaunchpadFactory clones, and end-to-end
+registration of a batch of collections one by one versus the bulk pipeline.
+
+    pip install "eth-tester[py-evm]"
+    python deploy_contract.py --build-only
+    python bench_deploy.py --count 20
+    python bench_deploy.py --bulk 100
+"""
+import argparse
+import json
+import os
+import statistics
+import tempfile
+import time
+
+from web3 import Web3, EthereumTesterProvider
+
+import blockchain_utils
+import nft_data
+from deploy_contract import load_artifact, FACTORY_ARTIFACT_PATH
+
+def setup_local_chain() -> Web3:
+    """Points blockchain_utils at an in-process EVM and funds a fresh agent wallet."""
+    w3 = Web3(EthereumTesterProvider())
+    funder = w3.eth.accounts[0]
+
+    agent = w3.eth.account.create()
+    tx_hash = w3.eth.send_transaction({"from": funder, "to": agent.address, "value": w3.to_wei(100, "ether")})
+    w3.eth.wait_for_transaction_receipt(tx_hash)
+
+    os.environ["AGENT_PRIVATE_KEY"] = agent.key.hex()
+    blockchain_utils._w3 = w3
+    return w3
+
+def setup_factory(w3: Web3) -> str:
+    artifact = load_artifact(FACTORY_ARTIFACT_PATH)
+    Factory = w3.eth.contract(abi=artifact["abi"], bytecode=artifact["bytecode"])
+    tx_hash = Factory.constructor().transact({"from": w3.eth.accounts[0]})
+    factory_address = w3.eth.wait_for_transaction_receipt(tx_hash).contractAddress
+
+    blockchain_utils.LAUNCHPAD_FACTORY_ADDRESS = factory_address
+    blockchain_utils.FACTORY_ARTIFACT = artifact
+    return factory_address
+
+def check_clone_address(w3: Web3, result: dict, receipt):
+    """Fails unless the locally predicted address is where the factory really deployed the clone."""
+    factory = w3.eth.contract(address=blockchain_utils.LAUNCHPAD_FACTORY_ADDRESS, abi=blockchain_utils.FACTORY_ARTIFACT["abi"])
+    deployed = factory.events.CollectionCreated().process_receipt(receipt)[0]["args"]["collection"]
+    if deployed != result["contract_address"]:
+        raise RuntimeError(f"Predicted clone address {result['contract_address']} but the factory deployed {deployed}")
+
+def bench_path(w3: Web3, deploy_fn, count: int, prefix: str, check=None) -> dict:
+    gas_used, send_times, confirm_times = [], [], []
+    for i in range(count):
+        start = time.perf_counter()
+        result = json.loads(deploy_fn(f"{prefix} Collection {i}", f"B{i}"))
+        sent = time.perf_counter()
+        if result.get("status") != "success":
+            raise RuntimeError(f"{prefix} deploy failed: {result.get('message')}")
+
+        receipt = w3.eth.wait_for_transaction_receipt(result["deploy_tx"])
+        confirmed = time.perf_counter()
+        if receipt.status != 1:
+            raise RuntimeError(f"{prefix} deploy reverted: {result['deploy_tx']}")
+        if check:
+            check(w3, result, receipt)
+        if not w3.eth.get_code(result["contract_address"]):
+            raise RuntimeError(f"{prefix} deploy left no code at {result['contract_address']}")
+
+        gas_used.append(receipt.gasUsed)
+        send_times.append(sent - start)
+        confirm_times.append(confirmed - start)
+
+    return {
+        "gas": statistics.mean(gas_used),
+        "send_ms": statistics.mean(send_times) * 1000,
+        "confirm_ms": statistics.mean(confirm_times) * 1000,
+    }
+
+def bench_bulk(count: int) -> dict:
+    """End-to-end registration time for `count` collections, serial vs bulk."""
+    specs = [
+        {"collection_name": f"Bulk Collection {i}", "symbol": f"BC{i}", "price_eth": 0.01, "supply": 100, "description": "Benchmark collection"}
+        for i in range(count)
+    ]
+    timings = {}
+    for label in ("serial", "bulk"):
+        # Each run registers the same names, so give it a fresh registry
+        nft_data._DB_PATH = os.path.join(tempfile.mkdtemp(), "collections_db.json")
+        start = time.perf_counter()
+        if label == "serial":
+            for spec in specs:
+                result = json.loads(nft_data.register_new_collection(**spec))
+                if "error" in result:
+                    raise RuntimeError(result["error"])
+        else:
+            result = json.loads(nft_data.register_collections_bulk(specs))
+            if not result.get("success"):
+                raise RuntimeError(result.get("error") or result["collections"])
+        timings[label] = time.perf_counter() - start
+        if len(nft_data._load_db()) != count:
+            raise RuntimeError(f"{label} run registered {len(nft_data._load_db())} of {count} collections")
+    return timings
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark full vs clone collection deploys on a local EVM")
+    parser.add_argument("--count", type=int, default=20, help="deploys per path (default: 20)")
+    parser.add_argument("--bulk", type=int, metavar="N", help="instead, time registering N collections serially vs in bulk")
+    args = parser.parse_args()
+
+    w3 = setup_local_chain()
+
+    if args.bulk:
+        timings = bench_bulk(args.bulk)
+        for label, seconds in timings.items():
+            print(f"{label:<8}{seconds:>8.2f} s  ({seconds / args.bulk * 1000:.1f} ms/collection)")
+        print(f"Bulk pipeline is {timings['serial'] / timings['bulk']:.1f}x faster end to end.")
+        return
+    results = {"full": bench_path(w3, blockchain_utils.deploy_nft_contract, args.count, "Full")}
+
+    if os.path.exists(FACTORY_ARTIFACT_PATH):
+        setup_factory(w3)
+        results["clone"] = bench_path(w3, blockchain_utils.deploy_nft_clone, args.count, "Clone", check=check_clone_address)
+    else:
+        print("factory_artifact.json not found; run `python deploy_contract.py --build-only` to benchmark clones.")
+
+    print(f"{'path':<8}{'gas/deploy':>14}{'send ms':>12}{'confirmed ms':>15}")
+    for path, r in results.items():
+        print(f"{path:<8}{r['gas']:>14,.0f}{r['send_ms']:>12.1f}{r['confirm_ms']:>15.1f}")
+    if "clone" in results:
+        print(f"Clone deploys use {results['clone']['gas'] / results['full']['gas']:.1%} of the full deploy gas.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Tracks cold-start cost of the Vercel entrypoint: an `-X importtime` breakdown of
+`api/index.py` and the time-to-first-response of fresh processes per route.
+
+    python bench_startup.py
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Runs inside a fresh interpreter: import the app, serve one request, report what got loaded
+_FIRST_RESPONSE_SCRIPT = """
+import sys
+sys.path.insert(0, "api")
+from index import app
+client = app.test_client()
+method, path = sys.argv[1], sys.argv[2]
+if method == "POST":
+    resp = client.post(path, json={"message": "hi", "history": []})
+else:
+    resp = client.get(path)
+resp.get_data()
+heavy = [m for m in ("flask", "web3", "opengradient", "agent", "blockchain_utils") if m in sys.modules]
+print(resp.status_code, ",".join(heavy))
+"""
+
+_REGISTRY_SCRIPT = """
+import sys
+import nft_data
+nft_data.get_collection_info("ASPRO")
+heavy = [m for m in ("web3", "opengradient", "blockchain_utils") if m in sys.modules]
+print(200, ",".join(heavy))
+"""
+
+ROUTES = [
+    ("GET", "/"),
+    ("GET", "/style.css"),
+    ("POST", "/api/chat"),
+]
+
+def import_breakdown(top: int, depth: int):
+    """Prints the slowest imports pulled in by api/index.py, down to `depth` levels."""
+    env = {k: v for k, v in os.environ.items() if k != "AGENT_PRIVATE_KEY"}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import sys; sys.path.insert(0, 'api'); import index"],
+        cwd=ROOT_DIR, env=env, capture_output=True, text=True,
+    )
+    total_us = 0
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line.split(":", 1)[1].split("|", 2)
+        # importtime nests each level two spaces deeper after the separator space
+        level = (len(name) - len(name.lstrip()) - 1) // 2
+        if name.strip() == "index" and level == 0:
+            total_us = int(cumulative_us)
+        elif 1 <= level <= depth:
+            rows.append((int(cumulative_us), name.strip()))
+
+    rows.sort(reverse=True)
+    print(f"Import time of api/index.py: {total_us / 1000:.1f} ms")
+    for cumulative_us, name in rows[:top]:
+        print(f"  {cumulative_us / 1000:8.1f} ms  {name}")
+
+def first_response(runs: int):
+    """Times fresh processes from spawn until their first response is served."""
+    env = {k: v for k, v in os.environ.items() if k != "AGENT_PRIVATE_KEY"}
+    cases = [(f"{method} {path}", [sys.executable, "-c", _FIRST_RESPONSE_SCRIPT, method, path]) for method, path in ROUTES]
+    cases.append(("registry lookup", [sys.executable, "-c", _REGISTRY_SCRIPT]))
+
+    print(f"Time to first response (median of {runs} cold processes):")
+    for label, cmd in cases:
+        timings = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            proc = subprocess.run(cmd, cwd=ROOT_DIR, env=env, capture_output=True, text=True)
+            timings.append(time.perf_counter() - start)
+            if proc.returncode != 0:
+                print(f"  {label}: failed\n{proc.stderr}")
+                break
+        else:
+            status, _, loaded = proc.stdout.strip().rpartition("\n")[2].partition(" ")
+            timings.sort()
+            print(f"  {label:<16} {timings[len(timings) // 2] * 1000:8.1f} ms  status={status}  loaded=[{loaded}]")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cold start of the launchpad API")
+    parser.add_argument("--top", type=int, default=15, help="slowest imports to list (default: 15)")
+    parser.add_argument("--depth", type=int, default=2, help="import tree levels below api/index.py to list (default: 2)")
+    parser.add_argument("--runs", type=int, default=5, help="cold processes per route (default: 5)")
+    args = parser.parse_args()
+
+    import_breakdown(args.top, args.depth)
+    print()
+    first_response(args.runs)
+
+if __name__ == "__main__":
+    main()
@@ -1,48 +1,170 @@
 import time
 import os
 import json
-from web3 import Web3
+import threading
 
-# Using Base Sepolia for realistic testing of receipts
-w3 = Web3(Web3.HTTPProvider("https://sepolia.base.org"))
+from deploy_contract import load_artifact, FACTORY_ARTIFACT_PATH
+
+# Built on first use so that importing this module never pays for web3
+_w3 = None
+
+def get_w3():
+    """Returns the shared Web3 client, constructing it on first call."""
+    global _w3
+    if _w3 is None:
+        from web3 import Web3
+        # Using Base Sepolia for realistic testing of receipts
+        _w3 = Web3(Web3.HTTPProvider("https://sepolia.base.org"))
+    return _w3
 
 AGENT_WALLET = "0x32e75870fB68372d703ED6867cF6A1E52C4769EE"
 
+# Clone deploys and mints return before confirming, so concurrent sends from the
+# agent wallet must take "pending" nonces one at a time
+_nonce_lock = threading.Lock()
+
 # Fee charged to deploy a new custom NFT collection to the Launchpad
 DEPLOYMENT_FEE_ETH = 0.01
 
+# Validate the precompiled contract artifact once at startup (no solcx needed at runtime).
+# A stale artifact is refused rather than deploying bytecode that no longer matches the source.
+try:
+    CONTRACT_ARTIFACT = load_artifact()
+    _ARTIFACT_ERROR = None
+except Exception as e:
+    CONTRACT_ARTIFACT = None
+    _ARTIFACT_ERROR = str(e)
+
+# Optional LaunchpadFactory: when configured, new collections are deployed as cheap
+# EIP-1167 clones at CREATE2 addresses that are known before the transaction confirms.
+LAUNCHPAD_FACTORY_ADDRESS = os.environ.get("LAUNCHPAD_FACTORY_ADDRESS")
+FACTORY_ARTIFACT = None
+if LAUNCHPAD_FACTORY_ADDRESS:
+    try:
+        FACTORY_ARTIFACT = load_artifact(FACTORY_ARTIFACT_PATH)
+    except Exception as e:
+        print(f"Factory artifact unavailable, falling back to full deploys: {e}")
+
+# EIP-1167 minimal proxy init code around the 20-byte implementation address
+_CLONE_PREFIX = bytes.fromhex("3d602d80600a3d3981f3363d3d373d3d3d363d73")
+_CLONE_SUFFIX = bytes.fromhex("5af43d82803e903d91602b57fd5bf3")
+
+# Filled in on the first clone deploy; the factory's implementation never changes
+_factory_implementation = None
+
+def collection_salt(collection_name: str) -> bytes:
+    """CREATE2 salt for a collection; names are unique case-insensitively on the launchpad."""
+    from web3 import Web3
+    return Web3.keccak(text=collection_name.strip().lower())
+
+def predict_clone_address(factory_address: str, implementation: str, creator: str, salt: bytes) -> str:
+    """Mirrors LaunchpadFactory.predictAddress without an RPC round trip."""
+    from web3 import Web3
+    init_code_hash = Web3.keccak(_CLONE_PREFIX + bytes.fromhex(implementation[2:]) + _CLONE_SUFFIX)
+    final_salt = Web3.keccak(bytes.fromhex(creator[2:]) + salt)
+    digest = Web3.keccak(b"\xff" + bytes.fromhex(factory_address[2:]) + final_salt + init_code_hash)
+    return Web3.to_checksum_address(digest[12:])
+
+def _load_factory(w3, creator: str):
+    """Returns the factory contract, checking once that local address prediction matches it."""
+    global _factory_implementation
+    factory_address = w3.to_checksum_address(LAUNCHPAD_FACTORY_ADDRESS)
+    factory = w3.eth.contract(address=factory_address, abi=FACTORY_ARTIFACT["abi"])
+
+    if _factory_implementation is None:
+        implementation = factory.functions.implementation().call()
+        probe_salt = collection_salt("")
+        expected = factory.functions.predictAddress(creator, probe_salt).call()
+        if predict_clone_address(factory_address, implementation, creator, probe_salt) != expected:
+            raise RuntimeError("Local clone address prediction does not match LaunchpadFactory.predictAddress.")
+        _factory_implementation = implementation
+
+    return factory, factory_address
+
+def deploy_collection(collection_name: str, symbol: str) -> str:
+    """Deploys a new collection through the factory when configured, else as a full contract."""
+    if LAUNCHPAD_FACTORY_ADDRESS and FACTORY_ARTIFACT is not None:
+        return deploy_nft_clone(collection_name, symbol)
+    return deploy_nft_contract(collection_name, symbol)
+
+def deploy_nft_clone(collection_name: str, symbol: str) -> str:
+    """
+    Deploys a new collection as an EIP-1167 clone through the LaunchpadFactory.
+    Returns as soon as the transaction is sent: the CREATE2 address is computed
+    locally, so the collection can be registered before the deploy confirms.
+    """
+    w3 = get_w3()
+    try:
+        private_key = os.environ.get("AGENT_PRIVATE_KEY")
+        if not private_key:
+            return json.dumps({"status": "error", "message": "Server configuration error: AGENT_PRIVATE_KEY is missing."})
+
+        account = w3.eth.account.from_key(private_key)
+        factory, factory_address = _load_factory(w3, account.address)
+
+        salt = collection_salt(collection_name)
+        predicted_address = predict_clone_address(factory_address, _factory_implementation, account.address, salt)
+
+        # The salt only depends on the name, so a name reused after the registry was
+        # lost maps to an existing clone; createCollection would revert there
+        if w3.eth.get_code(predicted_address):
+            return json.dumps({"status": "error", "message": f"A collection contract already exists at {predicted_address}. Please choose a different name."})
+
+        with _nonce_lock:
+            nonce = w3.eth.get_transaction_count(account.address, "pending")
+            built_tx = factory.functions.createCollection(collection_name, symbol, salt).build_transaction({
+                "from": account.address,
+                "nonce": nonce,
+                "maxFeePerGas": w3.eth.max_priority_fee + (2 * w3.eth.get_block("pending")["baseFeePerGas"]),
+                "maxPriorityFeePerGas": w3.eth.max_priority_fee,
+            })
+
+            signed_tx = w3.eth.account.sign_transaction(built_tx, private_key=private_key)
+            tx_hash = w3.eth.send_raw_transaction(signed_tx.raw_transaction)
+
+        return json.dumps({
+            "status": "success",
+            "contract_address": predicted_address,
+            "deploy_tx": w3.to_hex(tx_hash),
+            "confirmed": False
+        })
+
+    except Exception as e:
+        return json.dumps({"status": "error", "message": str(e)})
+
 def deploy_nft_contract(collection_name: str, symbol: str) -> str:
     """
     Deploys a real ERC721 smart contract to Base Sepolia for a new collection.
     Returns the deployed contract address, or an error message.
     """
+    w3 = get_w3()
     try:
         private_key = os.environ.get("AGENT_PRIVATE_KEY")
         if not private_key:
             return json.dumps({"status": "error", "message": "Server configuration error: AGENT_PRIVATE_KEY is missing."})
 
-        # Load the precompiled contract artifact (no solcx needed at runtime)
-        artifact_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "contract_artifact.json")
-        with open(artifact_path, "r") as f:
-            artifact = json.load(f)
+        if CONTRACT_ARTIFACT is None:
+            return json.dumps({"status": "error", "message": f"Contract artifact unavailable: {_ARTIFACT_ERROR}"})
 
-        bytecode = artifact["bytecode"]
-        abi = artifact["abi"]
+        bytecode = CONTRACT_ARTIFACT["bytecode"]
+        abi = CONTRACT_ARTIFACT["abi"]
 
         account = w3.eth.account.from_key(private_key)
         Contract = w3.eth.contract(abi=abi, bytecode=bytecode)
-        nonce = w3.eth.get_transaction_count(account.address)
-
-        # Build the deployment transaction with name & symbol constructor args
-        built_tx = Contract.constructor(collection_name, symbol).build_transaction({
-            "from": account.address,
-            "nonce": nonce,
-            "maxFeePerGas": w3.eth.max_priority_fee + (2 * w3.eth.get_block("pending")["baseFeePerGas"]),
-            "maxPriorityFeePerGas": w3.eth.max_priority_fee,
-        })
 
-        signed_tx = w3.eth.account.sign_transaction(built_tx, private_key=private_key)
-        tx_hash = w3.eth.send_raw_transaction(signed_tx.raw_transaction)
+        with _nonce_lock:
+            nonce = w3.eth.get_transaction_count(account.address, "pending")
+
+            # Build the deployment transaction with name & symbol constructor args
+            built_tx = Contract.constructor(collection_name, symbol).build_transaction({
+                "from": account.address,
+                "nonce": nonce,
+                "maxFeePerGas": w3.eth.max_priority_fee + (2 * w3.eth.get_block("pending")["baseFeePerGas"]),
+                "maxPriorityFeePerGas": w3.eth.max_priority_fee,
+            })
+
+            signed_tx = w3.eth.account.sign_transaction(built_tx, private_key=private_key)
+            tx_hash = w3.eth.send_raw_transaction(signed_tx.raw_transaction)
 
         # Wait for the mining receipt to get the real contract address
         receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
@@ -51,16 +173,128 @@ def deploy_nft_contract(collection_name: str, symbol: str) -> str:
         return json.dumps({
             "status": "success",
             "contract_address": contract_address,
-            "deploy_tx": w3.to_hex(tx_hash)
+            "deploy_tx": w3.to_hex(tx_hash),
+            "confirmed": True
         })
 
     except Exception as e:
         return json.dumps({"status": "error", "message": str(e)})
 
+def deploy_collections_batch(collections: list, timeout: int = 300) -> str:
+    """
+    Deploys many collections in one pipeline: fee data and the nonce are fetched once,
+    every transaction is sent with consecutive nonces, and confirmations are awaited
+    together afterwards. `collections` holds {"collection_name", "symbol"} dicts.
+    Returns a JSON list of per-collection results in input order.
+    """
+    w3 = get_w3()
+    private_key = os.environ.get("AGENT_PRIVATE_KEY")
+    if not private_key:
+        return json.dumps([{"status": "error", "message": "Server configuration error: AGENT_PRIVATE_KEY is missing."}] * len(collections))
+
+    use_factory = bool(LAUNCHPAD_FACTORY_ADDRESS and FACTORY_ARTIFACT is not None)
+    if not use_factory and CONTRACT_ARTIFACT is None:
+        return json.dumps([{"status": "error", "message": f"Contract artifact unavailable: {_ARTIFACT_ERROR}"}] * len(collections))
+
+    results = [None] * len(collections)
+    sent = []
+    try:
+        account = w3.eth.account.from_key(private_key)
+        if use_factory:
+            factory, factory_address = _load_factory(w3, account.address)
+        else:
+            Contract = w3.eth.contract(abi=CONTRACT_ARTIFACT["abi"], bytecode=CONTRACT_ARTIFACT["bytecode"])
+
+        # Names whose clone address already holds a contract would revert, both when
+        # sent and when used for the gas estimate, so drop them before either
+        predicted = {}
+        if use_factory:
+            for i, spec in enumerate(collections):
+                salt = collection_salt(spec["collection_name"])
+                predicted_address = predict_clone_address(factory_address, _factory_implementation, account.address, salt)
+                if w3.eth.get_code(predicted_address):
+                    results[i] = {"status": "error", "message": f"A collection contract already exists at {predicted_address}."}
+                else:
+                    predicted[i] = (salt, predicted_address)
+        pending = [i for i in range(len(collections)) if results[i] is None]
+        if not pending:
+            return json.dumps(results)
+
+        priority_fee = w3.eth.max_priority_fee
+        max_fee = priority_fee + (2 * w3.eth.get_block("pending")["baseFeePerGas"])
+
+        # Storage gas only grows with the UTF-8 byte length of the strings, so one estimate
+        # for the longest name and symbol (plus a 10% buffer) covers the batch; unused gas
+        # is never charged
+        longest = max(pending, key=lambda i: len(collections[i]["collection_name"].encode("utf-8")))
+        longest_name = collections[longest]["collection_name"]
+        longest_symbol = max((collections[i]["symbol"] for i in pending), key=lambda v: len(v.encode("utf-8")))
+        if use_factory:
+            estimate_call = factory.functions.createCollection(longest_name, longest_symbol, predicted[longest][0])
+        else:
+            estimate_call = Contract.constructor(longest_name, longest_symbol)
+        gas_limit = int(estimate_call.estimate_gas({"from": account.address}) * 1.1)
+    except Exception as e:
+        return json.dumps([{"status": "error", "message": str(e)}] * len(collections))
+
+    # 1. Send everything back to back; a nonce is only consumed by a successful send
+    with _nonce_lock:
+        try:
+            nonce = w3.eth.get_transaction_count(account.address, "pending")
+        except Exception as e:
+            return json.dumps([{"status": "error", "message": str(e)}] * len(collections))
+
+        for i in pending:
+            spec = collections[i]
+            tx_params = {
+                "from": account.address,
+                "nonce": nonce,
+                "gas": gas_limit,
+                "maxFeePerGas": max_fee,
+                "maxPriorityFeePerGas": priority_fee,
+            }
+            try:
+                if use_factory:
+                    salt, predicted_address = predicted[i]
+                    built_tx = factory.functions.createCollection(spec["collection_name"], spec["symbol"], salt).build_transaction(tx_params)
+                else:
+                    predicted_address = None
+                    built_tx = Contract.constructor(spec["collection_name"], spec["symbol"]).build_transaction(tx_params)
+
+                signed_tx = w3.eth.account.sign_transaction(built_tx, private_key=private_key)
+                tx_hash = w3.eth.send_raw_transaction(signed_tx.raw_transaction)
+            except Exception as e:
+                results[i] = {"status": "error", "message": str(e)}
+                continue
+
+            nonce += 1
+            sent.append((i, tx_hash, predicted_address))
+
+    # 2. The chain mines the whole pipeline in parallel, so wait against one shared deadline
+    deadline = time.monotonic() + timeout
+    for i, tx_hash, predicted_address in sent:
+        try:
+            remaining = max(1, deadline - time.monotonic())
+            receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=remaining)
+            if receipt.status != 1:
+                results[i] = {"status": "error", "message": f"Deployment reverted: {w3.to_hex(tx_hash)}"}
+                continue
+            results[i] = {
+                "status": "success",
+                "contract_address": predicted_address or receipt.contractAddress,
+                "deploy_tx": w3.to_hex(tx_hash),
+                "confirmed": True
+            }
+        except Exception as e:
+            results[i] = {"status": "error", "message": f"No receipt for {w3.to_hex(tx_hash)}: {e}"}
+
+    return json.dumps(results)
+
 def verify_payment_transaction(tx_hash: str, expected_amount_eth: float) -> str:
     """
     Checks if a transaction successfully sent the expected amount of ETH to the Agent Wallet.
     """
+    w3 = get_w3()
     if not w3.is_connected():
         return "Failed to connect to the blockchain RPC."
         
@@ -89,12 +323,13 @@ def verify_payment_transaction(tx_hash: str, expected_amount_eth: float) -> str:
     except Exception as e:
         return f"Error verifying transaction: {str(e)}"
 
-from nft_data import get_collection_info
+from nft_data import get_collection_info, remove_collection
 
 def execute_mint_nft(user_address: str, collection_name: str) -> str:
     """
     Executes a real smart contract mint function on the Base Sepolia testnet.
     """
+    w3 = get_w3()
     info_json = get_collection_info(collection_name)
     info = json.loads(info_json)
     
@@ -112,6 +347,32 @@ def execute_mint_nft(user_address: str, collection_name: str) -> str:
         with open(abi_path, "r") as f:
             abi = json.load(f)
             
+        # Clone deploys are registered before they confirm, so check how the deploy
+        # transaction actually ended before minting into that address
+        deploy_pending = False
+        deploy_tx = info.get("deploy_tx")
+        if deploy_tx:
+            from web3.exceptions import TransactionNotFound
+            try:
+                deploy_receipt = w3.eth.get_transaction_receipt(deploy_tx)
+            except TransactionNotFound:
+                deploy_receipt = None
+            if deploy_receipt is None:
+                deploy_pending = True
+            elif deploy_receipt.status != 1:
+                remove_collection(info["name"])
+                return json.dumps({
+                    "status": "error",
+                    "message": f"The {collection_name} contract deployment failed on-chain, so it has been removed from the launchpad. Please deploy it again."
+                })
+
+        # A call to an address without code would "succeed" without minting anything
+        if deploy_pending or not w3.eth.get_code(w3.to_checksum_address(contract_address)):
+            return json.dumps({
+                "status": "error",
+                "message": f"The {collection_name} contract deployment has not confirmed yet. Please try again shortly."
+            })
+
         contract = w3.eth.contract(address=contract_address, abi=abi)
         
         # Agent's private key to sponsor the mint transaction
@@ -123,20 +384,21 @@ def execute_mint_nft(user_address: str, collection_name: str) -> str:
             })
         account = w3.eth.account.from_key(private_key)
         
-        nonce = w3.eth.get_transaction_count(account.address)
-        
         checksum_address = w3.to_checksum_address(user_address)
         
-        # Build the Mint Transaction
-        built_tx = contract.functions.mint(checksum_address).build_transaction({
-            'from': account.address,
-            'nonce': nonce,
-            'maxFeePerGas': w3.eth.max_priority_fee + (2 * w3.eth.get_block('pending')['baseFeePerGas']),
-            'maxPriorityFeePerGas': w3.eth.max_priority_fee,
-        })
-        
-        signed_tx = w3.eth.account.sign_transaction(built_tx, private_key=private_key)
-        tx_hash = w3.eth.send_raw_transaction(signed_tx.raw_transaction)
+        with _nonce_lock:
+            nonce = w3.eth.get_transaction_count(account.address, 'pending')
+
+            # Build the Mint Transaction
+            built_tx = contract.functions.mint(checksum_address).build_transaction({
+                'from': account.address,
+                'nonce': nonce,
+                'maxFeePerGas': w3.eth.max_priority_fee + (2 * w3.eth.get_block('pending')['baseFeePerGas']),
+                'maxPriorityFeePerGas': w3.eth.max_priority_fee,
+            })
+
+            signed_tx = w3.eth.account.sign_transaction(built_tx, private_key=private_key)
+            tx_hash = w3.eth.send_raw_transaction(signed_tx.raw_transaction)
         
         return json.dumps({
             "status": "success",
@@ -1,24 +1,151 @@
 import os
-from solcx import compile_source, install_solc
-from web3 import Web3
+import argparse
+import hashlib
 import json
+import tempfile
+import time
 
-def deploy():
-    # Attempt to install solc if missing
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+SOURCE_PATH = os.path.join(ROOT_DIR, "AsproLaunchpad.sol")
+FACTORY_SOURCE_PATH = os.path.join(ROOT_DIR, "LaunchpadFactory.sol")
+SOURCE_PATHS = [SOURCE_PATH, FACTORY_SOURCE_PATH]
+ARTIFACT_PATH = os.path.join(ROOT_DIR, "contract_artifact.json")
+ABI_PATH = os.path.join(ROOT_DIR, "aspro_abi.json")
+FACTORY_ARTIFACT_PATH = os.path.join(ROOT_DIR, "factory_artifact.json")
+CACHE_DIR = os.path.join(ROOT_DIR, ".build_cache")
+
+SOLC_VERSION = "0.8.20"
+# Passed straight through to solcx.compile_files; part of the cache key
+COMPILER_SETTINGS = {"optimize": False}
+CONTRACT_NAME = "MinimalERC721"
+FACTORY_CONTRACT_NAME = "LaunchpadFactory"
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+def source_hash() -> str:
+    """One hash over every Solidity source, since the factory imports the collection."""
+    digests = []
+    for path in SOURCE_PATHS:
+        with open(path, "rb") as f:
+            digests.append(f"{os.path.basename(path)}:{_sha256(f.read())}")
+    return _sha256("\n".join(digests).encode())
+
+def build_key(src_hash: str) -> str:
+    """Cache key covering everything that affects the compiled output."""
+    key_material = json.dumps({
+        "source_sha256": src_hash,
+        "solc_version": SOLC_VERSION,
+        "settings": COMPILER_SETTINGS,
+    }, sort_keys=True)
+    return _sha256(key_material.encode())
+
+def _write_atomic(path: str, content: str):
+    """Writes via a temp file in the same directory so readers never see a partial file."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
     try:
-        install_solc("0.8.20")
+        with os.fdopen(fd, "w") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
     except Exception:
-        pass
+        os.unlink(tmp_path)
+        raise
+
+def _compile() -> dict:
+    # Only pay for solcx (and its network check) when the cache misses
+    from solcx import compile_files, get_installed_solc_versions, install_solc
+
+    if SOLC_VERSION not in {str(v) for v in get_installed_solc_versions()}:
+        print(f"Installing solc {SOLC_VERSION}...")
+        install_solc(SOLC_VERSION)
+
+    compiled = compile_files(SOURCE_PATHS, solc_version=SOLC_VERSION, allow_paths=ROOT_DIR, **COMPILER_SETTINGS)
+    return {name.split(":")[-1]: interface for name, interface in compiled.items()}
+
+def build(force: bool = False) -> dict:
+    """
+    Compiles AsproLaunchpad.sol and LaunchpadFactory.sol into contract_artifact.json,
+    factory_artifact.json and aspro_abi.json.
+    Compiled output is cached under .build_cache keyed by source hash, compiler
+    version and settings, so unchanged sources never invoke solc.
+    """
+    src_hash = source_hash()
+    key = build_key(src_hash)
+    cache_path = os.path.join(CACHE_DIR, f"{key}.json")
+
+    if not force and os.path.exists(cache_path):
+        with open(cache_path, "r") as f:
+            contracts = json.load(f)
+        print(f"Build cache hit ({key[:12]})")
+    else:
+        print("Compiling contract...")
+        compiled = _compile()
+        contracts = {name: {"bytecode": c["bin"], "abi": c["abi"]} for name, c in compiled.items()}
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        _write_atomic(cache_path, json.dumps(contracts, sort_keys=True))
+
+    stamp = {
+        "source_sha256": src_hash,
+        "solc_version": SOLC_VERSION,
+        "settings": COMPILER_SETTINGS,
+        "build_key": key,
+    }
+    artifact = {**contracts[CONTRACT_NAME], "build": stamp}
+    factory_artifact = {**contracts[FACTORY_CONTRACT_NAME], "build": stamp}
 
-    with open("AsproLaunchpad.sol", "r") as f:
-        contract_source = f.read()
+    # Output is a pure function of the cache entry, so unchanged builds leave files untouched
+    outputs = {
+        ARTIFACT_PATH: json.dumps(artifact, indent=2) + "\n",
+        FACTORY_ARTIFACT_PATH: json.dumps(factory_artifact, indent=2) + "\n",
+        ABI_PATH: json.dumps(artifact["abi"]),
+    }
+    for path, content in outputs.items():
+        if os.path.exists(path):
+            with open(path, "r") as f:
+                if f.read() == content:
+                    continue
+        _write_atomic(path, content)
 
-    print("Compiling contract...")
-    compiled = compile_source(contract_source, solc_version="0.8.20")
-    contract_id, contract_interface = compiled.popitem()
+    return artifact
 
-    bytecode = contract_interface['bin']
-    abi = contract_interface['abi']
+def load_artifact(path: str = ARTIFACT_PATH) -> dict:
+    """
+    Loads a compiled artifact, rejecting it if its build stamp shows it was
+    compiled from different Solidity sources than the ones on disk.
+    """
+    with open(path, "r") as f:
+        artifact = json.load(f)
+
+    # Artifacts committed before build stamps existed carry no source hash to check;
+    # they are used as-is until the next `--build-only` stamps them
+    stamp = artifact.get("build")
+    if not stamp or not all(os.path.exists(src) for src in SOURCE_PATHS):
+        return artifact
+
+    if stamp["source_sha256"] != source_hash():
+        raise RuntimeError(
+            f"{os.path.basename(path)} is stale: it was compiled from different Solidity sources. "
+            f"Rebuild it with `python deploy_contract.py --build-only`."
+        )
+    return artifact
+
+def deploy(collection_name: str, symbol: str, factory: bool = False, force: bool = False):
+    start = time.perf_counter()
+    artifact = build(force=force)
+    print(f"Artifacts ready in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    if factory:
+        # The factory deploys its own CollectionImplementation and takes no arguments
+        with open(FACTORY_ARTIFACT_PATH, "r") as f:
+            artifact = json.load(f)
+        constructor_args = ()
+    else:
+        constructor_args = (collection_name, symbol)
+
+    bytecode = artifact['bytecode']
+    abi = artifact['abi']
+
+    from web3 import Web3
 
     print("Connecting to Base Sepolia...")
     w3 = Web3(Web3.HTTPProvider("https://sepolia.base.org"))
@@ -31,24 +158,24 @@ def deploy():
         return
     account = w3.eth.account.from_key(private_key)
     print(f"Deploying from wallet: {account.address}")
-    
+
     balance = w3.eth.get_balance(account.address)
     print(f"Wallet Balance: {w3.from_wei(balance, 'ether')} ETH")
 
     AsproContract = w3.eth.contract(abi=abi, bytecode=bytecode)
 
     nonce = w3.eth.get_transaction_count(account.address)
-    
+
     # Estimate gas
-    construct_txn = AsproContract.constructor().build_transaction({
+    construct_txn = AsproContract.constructor(*constructor_args).build_transaction({
         'from': account.address,
         'nonce': nonce,
     })
-    
+
     gas_estimate = w3.eth.estimate_gas(construct_txn)
     gas_price_multiplier = 1.1 # 10% buffer
-    
-    built_tx = AsproContract.constructor().build_transaction({
+
+    built_tx = AsproContract.constructor(*constructor_args).build_transaction({
         'from': account.address,
         'nonce': nonce,
         'gas': int(gas_estimate * gas_price_multiplier),
@@ -68,10 +195,19 @@ def deploy():
 
     contract_address = tx_receipt.contractAddress
     print(f"Contract deployed successfully at: {contract_address}")
-    
-    # Save the ABI for the agent to use
-    with open("aspro_abi.json", "w") as f:
-        json.dump(abi, f)
+    if factory:
+        print(f"Set LAUNCHPAD_FACTORY_ADDRESS={contract_address} to deploy new collections as clones.")
 
 if __name__ == "__main__":
-    deploy()
+    parser = argparse.ArgumentParser(description="Build and deploy the launchpad NFT contract")
+    parser.add_argument("--name", default="ASPRO", help="collection name passed to the constructor")
+    parser.add_argument("--symbol", default="ASPRO", help="collection symbol passed to the constructor")
+    parser.add_argument("--factory", action="store_true", help="deploy the LaunchpadFactory instead of a single collection")
+    parser.add_argument("--build-only", action="store_true", help="refresh the artifacts without deploying")
+    parser.add_argument("--force", action="store_true", help="ignore the build cache and recompile")
+    args = parser.parse_args()
+
+    if args.build_only:
+        build(force=args.force)
+    else:
+        deploy(args.name, args.symbol, factory=args.factory, force=args.force)
@@ -1,6 +1,23 @@
+import argparse
 import asyncio
+import json
+import math
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 from agent import chat_with_agent
 
+# Degraded replies the agent and the HTTP endpoint stream back instead of raising.
+# For load testing these count as failed turns, keyed by the class shown in the report.
+_ERROR_MARKERS = [
+    ("Mock Mode", "MockMode"),
+    ("Demo Mode Activated", "PaymentRequired"),
+    ("API Server Temporarily Unavailable", "UpstreamUnavailable"),
+    ("Oops! My exact native AI SDK ran into an error", "AgentError"),
+    ("[Error]:", "StreamError"),
+]
+
 async def async_main():
     print("=========================================")
     print("🚀 Welcome to the AI NFT Launchpad 🚀")
@@ -32,8 +49,206 @@ async def async_main():
         except Exception as e:
             print(f"\n[Error connecting to agent]: {e}")
 
+def load_conversations(path: str) -> list:
+    """
+    Reads scripted conversations from a JSONL file, one conversation per line.
+    A line may hold a list of user turns under "turns", or a single turn under
+    "message" (or "body", so backlog-style files can be replayed as-is).
+    """
+    conversations = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line_no, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if isinstance(record, str):
+                turns = [record]
+            elif isinstance(record, list):
+                turns = record
+            elif "turns" in record:
+                turns = record["turns"]
+            else:
+                turn = record.get("message") or record.get("body")
+                turns = [turn] if turn else []
+            turns = [t for t in turns if isinstance(t, str) and t.strip()]
+            if not turns:
+                raise ValueError(f"{path}:{line_no}: no user turns found")
+            conversations.append(turns)
+    return conversations
+
+def _classify_reply(text: str):
+    for marker, error_class in _ERROR_MARKERS:
+        if marker in text:
+            return error_class
+    return None
+
+async def _agent_turn(message: str, history: list) -> dict:
+    start = time.perf_counter()
+    first_chunk = None
+    chunks = []
+    async for chunk in chat_with_agent(message, history):
+        if first_chunk is None:
+            first_chunk = time.perf_counter() - start
+        chunks.append(chunk)
+    return {"ttfc": first_chunk, "total": time.perf_counter() - start, "reply": "".join(chunks)}
+
+def _agent_turn_in_thread(message: str, history: list) -> dict:
+    # The agent makes blocking calls (approvals, receipt waits) on its event loop,
+    # so each in-process turn gets a loop of its own on a worker thread
+    return asyncio.run(_agent_turn(message, history))
+
+def _http_turn(url: str, message: str, history: list) -> dict:
+    import requests
+
+    start = time.perf_counter()
+    first_chunk = None
+    chunks = []
+    with requests.post(url, json={"message": message, "history": history}, stream=True, timeout=300) as resp:
+        if resp.status_code >= 400:
+            return {"ttfc": None, "total": time.perf_counter() - start, "reply": "", "error": f"HTTP{resp.status_code}"}
+        for chunk in resp.iter_content(chunk_size=None, decode_unicode=True):
+            if not chunk:
+                continue
+            if first_chunk is None:
+                first_chunk = time.perf_counter() - start
+            chunks.append(chunk)
+    return {"ttfc": first_chunk, "total": time.perf_counter() - start, "reply": "".join(chunks)}
+
+async def _replay_conversation(conv_id: int, turns: list, url, results: list):
+    history = []
+    for turn_no, message in enumerate(turns):
+        try:
+            if url:
+                outcome = await asyncio.to_thread(_http_turn, url, message, list(history))
+            else:
+                outcome = await asyncio.to_thread(_agent_turn_in_thread, message, list(history))
+        except Exception as e:
+            outcome = {"ttfc": None, "total": None, "reply": "", "error": type(e).__name__}
+
+        error = outcome.get("error") or _classify_reply(outcome["reply"])
+        results.append({
+            "conversation": conv_id,
+            "turn": turn_no,
+            "ttfc": outcome["ttfc"],
+            "total": outcome["total"],
+            "error": error,
+        })
+        if error:
+            # Later turns depend on this reply, so the rest of the script is meaningless
+            break
+
+        history.append({"role": "user", "content": message})
+        history.append({"role": "assistant", "content": outcome["reply"]})
+
+async def replay(conversations: list, concurrency: int = 4, rate=None, url=None) -> tuple:
+    """
+    Replays conversations through the agent (or the HTTP endpoint when `url` is set).
+    Up to `concurrency` conversations run at once; with `rate`, conversation starts
+    follow a Poisson arrival process of `rate` conversations per second.
+    Returns the per-turn results and the wall-clock duration.
+    """
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=concurrency))
+
+    semaphore = asyncio.Semaphore(concurrency)
+    results = []
+
+    async def run_one(conv_id, turns):
+        async with semaphore:
+            await _replay_conversation(conv_id, turns, url, results)
+
+    start = time.perf_counter()
+    tasks = []
+    for conv_id, turns in enumerate(conversations):
+        if rate and conv_id > 0:
+            await asyncio.sleep(random.expovariate(rate))
+        tasks.append(asyncio.create_task(run_one(conv_id, turns)))
+    await asyncio.gather(*tasks)
+    return results, time.perf_counter() - start
+
+def percentile(values: list, pct: float):
+    """Nearest-rank percentile; returns None for an empty sample."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+def print_report(results: list, wall_time: float):
+    ok = [r for r in results if not r["error"]]
+    errors = {}
+    for r in results:
+        if r["error"]:
+            errors[r["error"]] = errors.get(r["error"], 0) + 1
+
+    print("=========================================")
+    print(f"Turns: {len(results)}  OK: {len(ok)}  Failed: {len(results) - len(ok)}")
+    ok_rate = len(ok) / wall_time if wall_time else 0
+    attempted_rate = len(results) / wall_time if wall_time else 0
+    print(f"Wall time: {wall_time:.2f}s  Throughput: {ok_rate:.2f} OK turns/s ({attempted_rate:.2f} turns/s attempted)")
+
+    for label, key in (("Time to first chunk", "ttfc"), ("Total turn time", "total")):
+        samples = [r[key] for r in ok if r[key] is not None]
+        if not samples:
+            print(f"{label}: no samples")
+            continue
+        stats = "  ".join(f"p{p}={percentile(samples, p) * 1000:.0f}ms" for p in (50, 90, 95, 99))
+        print(f"{label}: {stats}  max={max(samples) * 1000:.0f}ms")
+
+    for error_class, count in sorted(errors.items(), key=lambda item: -item[1]):
+        print(f"  {error_class}: {count}")
+    print("=========================================")
+
+def import_collections(path: str):
+    from nft_data import load_collection_specs, register_collections_bulk
+
+    specs = load_collection_specs(path)
+    print(f"Importing {len(specs)} collections from {path}...")
+    start = time.perf_counter()
+    result = json.loads(register_collections_bulk(specs))
+    elapsed = time.perf_counter() - start
+
+    if "error" in result:
+        print(f"[Error]: {result['error']}")
+        for invalid in result.get("invalid", []):
+            print(f"  row {invalid['row']} ({invalid['collection_name'] or '?'}): {'; '.join(invalid['errors'])}")
+        return
+
+    for entry in result["collections"]:
+        if "error" in entry:
+            print(f"  ❌ {entry['collection_name']}: {entry['error']}")
+        else:
+            print(f"  ✅ {entry['collection_name']}: {entry['contract_address']}")
+    print(f"{result['message']} ({elapsed:.2f}s)")
+
 def main():
-    asyncio.run(async_main())
+    parser = argparse.ArgumentParser(description="AI NFT Launchpad agent CLI")
+    parser.add_argument("--replay", metavar="FILE", help="replay scripted conversations from a JSONL file instead of chatting")
+    parser.add_argument("--concurrency", type=int, default=4, help="conversations replayed at once (default: 4)")
+    parser.add_argument("--rate", type=float, default=None, help="conversation arrival rate per second (default: as fast as concurrency allows)")
+    parser.add_argument("--url", default=None, help="replay against this /api/chat endpoint instead of the in-process agent")
+    parser.add_argument("--output", metavar="FILE", help="write per-turn results as JSONL")
+    parser.add_argument("--import", dest="import_file", metavar="FILE", help="bulk-deploy collections from a CSV or JSONL file of specs")
+    args = parser.parse_args()
+
+    if args.import_file:
+        import_collections(args.import_file)
+        return
+
+    if not args.replay:
+        asyncio.run(async_main())
+        return
+
+    conversations = load_conversations(args.replay)
+    print(f"Replaying {len(conversations)} conversations (concurrency={args.concurrency}, rate={args.rate or 'max'})...")
+    results, wall_time = asyncio.run(replay(conversations, args.concurrency, args.rate, args.url))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            for r in results:
+                f.write(json.dumps(r) + "\n")
+
+    print_report(results, wall_time)
 
 if __name__ == "__main__":
     main()
@@ -1,4 +1,6 @@
+import csv
 import json
+import math
 import os
 
 # Path for persisting user-deployed collections between serverless invocations
@@ -42,14 +44,15 @@ def _save_db(user_collections: dict):
     except Exception:
         pass
 
-# Build the live registry: base collections + any previously deployed ones
-NFT_COLLECTIONS = {**_BASE_COLLECTIONS, **_load_db()}
+def get_all_collections() -> dict:
+    """Returns the live registry: base collections + any previously deployed ones."""
+    return {**_BASE_COLLECTIONS, **_load_db()}
 
 
 def get_collection_info(collection_name: str) -> str:
     """Returns details about a specific NFT collection as a JSON string for the AI."""
     # Always reload from disk to catch collections deployed in other sessions
-    live = {**_BASE_COLLECTIONS, **_load_db()}
+    live = get_all_collections()
     name_key = collection_name.strip()
 
     for key, data in live.items():
@@ -59,9 +62,29 @@ def get_collection_info(collection_name: str) -> str:
     return json.dumps({"error": f"Collection '{collection_name}' not found on this launchpad."})
 
 
+def _make_entry(price_eth: float, supply: int, description: str, contract_address: str, deploy_tx: str) -> dict:
+    return {
+        "price_eth": float(price_eth),
+        "gas_estimate_eth": 0.005,
+        "is_free_mint": float(price_eth) == 0.0,
+        "supply": str(supply) if supply > 0 else "unlimited",
+        "contract_address": contract_address,
+        # Lets mints check how the deploy ended, since clones are registered before confirming
+        "deploy_tx": deploy_tx,
+        "description": description
+    }
+
+
+def remove_collection(collection_name: str):
+    """Drops a user-deployed collection from the registry, e.g. after its deploy reverted."""
+    user_collections = _load_db()
+    if user_collections.pop(collection_name, None) is not None:
+        _save_db(user_collections)
+
+
 def register_new_collection(collection_name: str, symbol: str, price_eth: float, supply: int, description: str) -> str:
     """Deploys a real ERC721 NFT collection smart contract and registers it on the Launchpad."""
-    from blockchain_utils import deploy_nft_contract
+    from blockchain_utils import deploy_collection
 
     name_key = collection_name.strip()
 
@@ -74,7 +97,7 @@ def register_new_collection(collection_name: str, symbol: str, price_eth: float,
             return json.dumps({"error": f"Collection '{collection_name}' already exists on this launchpad!"})
 
     # Deploy the real smart contract
-    result_json = deploy_nft_contract(collection_name=name_key, symbol=symbol.strip().upper())
+    result_json = deploy_collection(collection_name=name_key, symbol=symbol.strip().upper())
     result = json.loads(result_json)
 
     if result.get("status") != "success":
@@ -83,26 +106,143 @@ def register_new_collection(collection_name: str, symbol: str, price_eth: float,
     real_address = result["contract_address"]
     deploy_tx = result["deploy_tx"]
 
-    new_entry = {
-        "price_eth": float(price_eth),
-        "gas_estimate_eth": 0.005,
-        "is_free_mint": float(price_eth) == 0.0,
-        "supply": str(supply) if supply > 0 else "unlimited",
-        "contract_address": real_address,
-        "description": description
-    }
+    new_entry = _make_entry(price_eth, supply, description, real_address, deploy_tx)
 
     # Persist to disk so the collection survives across sessions
     user_collections[name_key] = new_entry
     _save_db(user_collections)
 
-    # Update in-memory dict too
-    NFT_COLLECTIONS[name_key] = new_entry
+    if result.get("confirmed", True):
+        message = f"🚀 Collection '{name_key}' ({symbol.upper()}) has been successfully deployed to Base Sepolia!"
+    else:
+        message = f"🚀 Collection '{name_key}' ({symbol.upper()}) is deploying to Base Sepolia and will be mintable once the transaction confirms!"
 
     return json.dumps({
         "success": True,
-        "message": f"🚀 Collection '{name_key}' ({symbol.upper()}) has been successfully deployed to Base Sepolia!",
+        "message": message,
         "contract_address": real_address,
         "deploy_tx_hash": deploy_tx,
         "basescan_url": f"https://sepolia.basescan.org/address/{real_address}"
     })
+
+
+def load_collection_specs(path: str) -> list:
+    """
+    Reads collection specs from a CSV (with a header row) or a JSONL file.
+    JSONL lines that are not a JSON object are kept as specs carrying an "_error",
+    so validation reports them alongside every other bad row.
+    """
+    # utf-8-sig drops the byte-order mark Excel writes, which would otherwise end up in the first header
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        if path.lower().endswith(".csv"):
+            return [dict(row) for row in csv.DictReader(f)]
+
+        specs = []
+        for line_no, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                spec = json.loads(line)
+            except ValueError as e:
+                spec = {"_error": f"line {line_no}: invalid JSON ({e.msg})"}
+            if not isinstance(spec, dict):
+                spec = {"_error": f"line {line_no}: expected a JSON object"}
+            specs.append(spec)
+        return specs
+
+
+def validate_collection_specs(specs: list) -> tuple:
+    """
+    Normalizes specs and checks them all in one pass, including name clashes
+    with the registry and within the batch. Returns (collections, errors).
+    """
+    taken = {key.lower() for key in get_all_collections()}
+    collections, errors = [], []
+
+    for row, spec in enumerate(specs, start=1):
+        if "_error" in spec:
+            errors.append({"row": row, "collection_name": "", "errors": [spec["_error"]]})
+            continue
+
+        name_key = str(spec.get("collection_name") or spec.get("name") or "").strip()
+        symbol = str(spec.get("symbol") or "").strip().upper()
+        description = str(spec.get("description") or "").strip()
+        problems = []
+
+        if not name_key:
+            problems.append("missing collection_name")
+        elif name_key.lower() in taken:
+            problems.append(f"collection '{name_key}' already exists")
+        if not symbol:
+            problems.append("missing symbol")
+        try:
+            price_eth = float(spec.get("price_eth", 0) or 0)
+            if not math.isfinite(price_eth):
+                problems.append(f"invalid price_eth {spec.get('price_eth')!r}")
+            elif price_eth < 0:
+                problems.append("price_eth must not be negative")
+        except (TypeError, ValueError):
+            problems.append(f"invalid price_eth {spec.get('price_eth')!r}")
+        try:
+            supply = int(spec.get("supply", 0) or 0)
+        except (TypeError, ValueError):
+            problems.append(f"invalid supply {spec.get('supply')!r}")
+
+        if problems:
+            errors.append({"row": row, "collection_name": name_key, "errors": problems})
+            continue
+
+        taken.add(name_key.lower())
+        collections.append({
+            "collection_name": name_key,
+            "symbol": symbol,
+            "price_eth": price_eth,
+            "supply": supply,
+            "description": description
+        })
+
+    return collections, errors
+
+
+def register_collections_bulk(specs: list) -> str:
+    """
+    Validates every spec up front, deploys all collections in a single pipeline,
+    and commits the successful ones to the registry in one write.
+    Nothing is deployed if any spec is invalid.
+    """
+    from blockchain_utils import deploy_collections_batch
+
+    collections, errors = validate_collection_specs(specs)
+    if errors:
+        return json.dumps({"error": f"{len(errors)} of {len(specs)} collection specs are invalid; nothing was deployed.", "invalid": errors})
+    if not collections:
+        return json.dumps({"error": "No collections to deploy."})
+
+    results = json.loads(deploy_collections_batch(collections))
+
+    user_collections = _load_db()
+    report = []
+    for spec, result in zip(collections, results):
+        name_key = spec["collection_name"]
+        if result.get("status") != "success":
+            report.append({"collection_name": name_key, "error": result.get("message", "Unknown error")})
+            continue
+
+        real_address = result["contract_address"]
+        user_collections[name_key] = _make_entry(spec["price_eth"], spec["supply"], spec["description"], real_address, result["deploy_tx"])
+        report.append({
+            "collection_name": name_key,
+            "contract_address": real_address,
+            "deploy_tx_hash": result["deploy_tx"],
+            "basescan_url": f"https://sepolia.basescan.org/address/{real_address}"
+        })
+
+    deployed = sum(1 for r in report if "error" not in r)
+    if deployed:
+        _save_db(user_collections)
+
+    return json.dumps({
+        "success": deployed == len(collections),
+        "message": f"🚀 Deployed {deployed} of {len(collections)} collections to Base Sepolia.",
+        "collections": report
+    })